@@ -0,0 +1,40 @@
+import sys
+import pytest
+
+from wrapper import __main__ as wmain
+
+
+@pytest.mark.parametrize(
+    "argv",
+    (
+        ["kernel", "--build-env", "local", "--base", "los", "--codename", "dumpling", "--lkv", "4.4"],
+        ["kernel", "--build-env=docker", "--base=pa", "--codename=cheeseburger", "--lkv=4.14", "-c", "--ksu"],
+        ["assets", "--build-env", "podman", "--base", "x", "--codename", "dumpling", "--chroot", "full", "--rom-only"],
+        ["bundle", "--build-env", "local", "--base", "los", "--codename", "dumpling", "--lkv", "4.4",
+         "--package-type", "conan", "--conan-upload", "--log-level", "quiet", "-o", "build.log"],
+    )
+)
+def test__fast_parse__matches_argparse(monkeypatch, argv: list[str]) -> None:
+    """Check that the fast parser gives the same result as argparse."""
+    monkeypatch.setattr(sys, "argv", ["wrapper"] + argv)
+    res_actual = wmain.parse_args()
+    monkeypatch.setattr(wmain, "_fast_parse", lambda argv: None)
+    res_expected = wmain.parse_args()
+    assert vars(res_actual) == vars(res_expected)
+
+
+@pytest.mark.parametrize(
+    "argv",
+    (
+        [],
+        ["--clean"],
+        ["kernel", "--help"],
+        ["kernel", "--build-env", "local", "--base", "los", "--codename", "dumpling"],
+        ["kernel", "--build-env", "local", "--base", "lineage", "--codename", "dumpling", "--lkv", "4.4"],
+        ["kernel", "--build", "local", "--base", "los", "--codename", "dumpling", "--lkv", "4.4"],
+        ["assets", "--build-env", "local", "--base", "los", "--codename", "-o", "--chroot", "full"],
+    )
+)
+def test__fast_parse__fallback(argv: list[str]) -> None:
+    """Check that non-trivial and invalid arguments are left to argparse."""
+    assert wmain._fast_parse(argv) is None
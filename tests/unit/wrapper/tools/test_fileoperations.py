@@ -0,0 +1,201 @@
+import io
+import sys
+import json
+import importlib
+import pytest
+import hashlib
+from pathlib import Path
+
+from wrapper.tools import fileoperations as fo
+
+
+class FakeResponse:
+    """A minimal stand-in for a streamed requests.Response."""
+
+    def __init__(self, url: str, body: bytes, status_code: int = 200, headers: dict | None = None) -> None:
+        self.url = url
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.raw = io.BytesIO(body)
+
+    def __enter__(self) -> "FakeResponse":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.raw.close()
+
+    def raise_for_status(self) -> None:
+        pass
+
+    def iter_content(self, chunk_size: int):
+        while chunk := self.raw.read(chunk_size):
+            yield chunk
+
+
+class FakeSession:
+    """A session serving a single file, optionally for byte ranges.
+
+    :param body: Contents of the served file.
+    :param ranges: Flag to answer range requests with their ranges.
+    :param short: Flag to answer range requests with one byte missing.
+    """
+
+    def __init__(self, body: bytes, ranges: bool = True, short: bool = False) -> None:
+        self.body = body
+        self.ranges = ranges
+        self.short = short
+        self.requested_ranges = []
+
+    def get(self, url: str, stream: bool = False, headers: dict | None = None) -> FakeResponse:
+        headers = headers or {}
+        if "Range" in headers:
+            self.requested_ranges.append(headers["Range"])
+            if self.ranges:
+                start, end = map(int, headers["Range"].removeprefix("bytes=").split("-"))
+                return FakeResponse(url, self.body[start:end + 1 - self.short], 206)
+        return FakeResponse(
+            url,
+            self.body,
+            headers={"Content-Length": str(len(self.body)), "Accept-Ranges": "bytes"}
+        )
+
+
+def use_fake_session(session: FakeSession, tmp_path: Path, monkeypatch) -> FakeSession:
+    """Run downloads in a temporary directory with a fake session."""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(fo, "PARALLEL_DOWNLOAD_SIZE", 100)
+    monkeypatch.setattr(fo, "_session", lambda: session)
+    return session
+
+
+def test__load_manifest__cached(tmp_path: Path) -> None:
+    """Check that a manifest is read from disk only once."""
+    manifest = tmp_path / "manifest.json"
+    manifest.write_text(json.dumps({"dumpling": {}}))
+    res_first = fo.load_manifest(manifest)
+    manifest.write_text(json.dumps({"cheeseburger": {}}))
+    res_second = fo.load_manifest(manifest)
+    assert res_first == {"dumpling": {}}
+    assert res_second is res_first
+
+
+def test__load_manifest__json_fallback(tmp_path: Path) -> None:
+    """Check that manifests are parsed with the json module when orjson is missing."""
+    manifest = tmp_path / "manifest.json"
+    manifest.write_text(json.dumps({"dumpling": {"4.4": {}}}))
+    orjson = sys.modules.pop("orjson", None)
+    sys.modules["orjson"] = None
+    try:
+        importlib.reload(fo)
+        assert fo.json_loads is json.loads
+        assert fo.load_manifest(manifest) == {"dumpling": {"4.4": {}}}
+    finally:
+        del sys.modules["orjson"]
+        if orjson is not None:
+            sys.modules["orjson"] = orjson
+        importlib.reload(fo)
+
+
+def test__ucopy__large_file(tmp_path: Path, monkeypatch) -> None:
+    """Check that a "large" file is copied into a directory with its mode."""
+    monkeypatch.setattr(fo, "LARGE_FILE_SIZE", 16)
+    src = tmp_path / "Image.gz-dtb"
+    src.write_bytes(b"zero" * 1024)
+    src.chmod(0o755)
+    dst = tmp_path / "out"
+    dst.mkdir()
+    fo.ucopy(src, dst)
+    assert (dst / src.name).read_bytes() == src.read_bytes()
+    assert (dst / src.name).stat().st_mode == src.stat().st_mode
+
+
+def test__ucopy__directory(tmp_path: Path) -> None:
+    """Check directory contents copying with exceptions."""
+    src = tmp_path / "src"
+    (src / "ramdisk").mkdir(parents=True)
+    (src / "ramdisk" / "init.nethunter.rc").write_text("on boot")
+    (src / "anykernel.sh").write_text("#!/bin/sh")
+    (src / "qcacld_pa.patch").write_text("diff")
+    dst = tmp_path / "dst"
+    fo.ucopy(src, dst, ("qcacld_pa.patch",))
+    assert sorted(p.name for p in dst.iterdir()) == ["anykernel.sh", "ramdisk"]
+    assert (dst / "ramdisk" / "init.nethunter.rc").read_text() == "on boot"
+
+
+def test__ucopy__missing_source(tmp_path: Path) -> None:
+    """Check that a missing source is skipped."""
+    (tmp_path / "anykernel.sh").write_text("#!/bin/sh")
+    dst = tmp_path / "dst"
+    fo.ucopy(tmp_path / "ramdisk", dst)
+    fo.ucopy(tmp_path / "anykernel.sh" / "ramdisk", dst)
+    assert not dst.exists()
+
+
+def test__ucopy__directory_error(tmp_path: Path) -> None:
+    """Check that an error while copying an entry is propagated."""
+    src = tmp_path / "src"
+    (src / "ramdisk").mkdir(parents=True)
+    dst = tmp_path / "dst"
+    (dst / "ramdisk").mkdir(parents=True)
+    with pytest.raises(FileExistsError):
+        fo.ucopy(src, dst)
+
+
+def test__verify_sha256__mismatch(tmp_path: Path) -> None:
+    """Check that a file with a wrong checksum is removed."""
+    fn = tmp_path / "F-Droid.apk"
+    fn.write_bytes(b"apk")
+    fo._verify_sha256(fn, hashlib.sha256(b"apk").hexdigest().upper())
+    assert fn.is_file()
+    with pytest.raises(SystemExit):
+        fo._verify_sha256(fn, hashlib.sha256(b"zero").hexdigest())
+    assert not fn.is_file()
+
+
+def test__download__parallel_ranges(tmp_path: Path, monkeypatch) -> None:
+    """Check that a large file is assembled from concurrently downloaded ranges."""
+    body = bytes(range(256)) * 4 + b"zero"
+    session = use_fake_session(FakeSession(body), tmp_path, monkeypatch)
+    fo.download("https://kali.download/kalifs-arm64-full.tar.xz")
+    assert (tmp_path / "kalifs-arm64-full.tar.xz").read_bytes() == body
+    assert sorted(session.requested_ranges) == sorted(
+        ["bytes=0-256", "bytes=257-513", "bytes=514-770", "bytes=771-1027"]
+    )
+
+
+def test__download__ranges_not_served(tmp_path: Path, monkeypatch) -> None:
+    """Check the fallback to a single stream when ranges are answered with the whole file."""
+    body = b"zero" * 64
+    use_fake_session(FakeSession(body, ranges=False), tmp_path, monkeypatch)
+    fo.download("https://kali.download/kalifs-arm64-full.tar.xz")
+    assert (tmp_path / "kalifs-arm64-full.tar.xz").read_bytes() == body
+
+
+def test__download__short_range(tmp_path: Path, monkeypatch) -> None:
+    """Check that an incomplete range fails the download."""
+    use_fake_session(FakeSession(b"zero" * 64, short=True), tmp_path, monkeypatch)
+    with pytest.raises(SystemExit):
+        fo.download("https://kali.download/kalifs-arm64-full.tar.xz")
+
+
+@pytest.mark.parametrize("parallel", (False, True))
+def test__download__sha256_match(tmp_path: Path, monkeypatch, parallel: bool) -> None:
+    """Check that a download with the expected checksum is kept."""
+    body = b"zero" * 64
+    use_fake_session(FakeSession(body), tmp_path, monkeypatch)
+    if not parallel:
+        monkeypatch.setattr(fo, "PARALLEL_DOWNLOAD_SIZE", len(body) + 1)
+    fo.download("https://f-droid.org/F-Droid.apk", sha256=hashlib.sha256(body).hexdigest())
+    assert (tmp_path / "F-Droid.apk").read_bytes() == body
+
+
+@pytest.mark.parametrize("parallel", (False, True))
+def test__download__sha256_mismatch(tmp_path: Path, monkeypatch, parallel: bool) -> None:
+    """Check that a download with a wrong checksum fails and is removed."""
+    body = b"zero" * 64
+    use_fake_session(FakeSession(body), tmp_path, monkeypatch)
+    if not parallel:
+        monkeypatch.setattr(fo, "PARALLEL_DOWNLOAD_SIZE", len(body) + 1)
+    with pytest.raises(SystemExit):
+        fo.download("https://f-droid.org/F-Droid.apk", sha256=hashlib.sha256(b"apk").hexdigest())
+    assert not (tmp_path / "F-Droid.apk").exists()
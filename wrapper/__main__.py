@@ -1,24 +1,197 @@
 import os
 import io
 import sys
-import json
 import argparse
 
 from wrapper.tools import cleaning as cm, messages as msg
 from wrapper.configs import ArgumentConfig, DirectoryConfig as dcfg
-from wrapper.engines import DockerEngine, PodmanEngine
-from wrapper.commands import KernelCommand, AssetsCommand, BundleCommand
+
+# common argument attributes for subparsers
+help_base = "select a kernel base for the build"
+help_codename = "select device codename"
+help_benv = "select build environment"
+help_clean = "remove Docker/Podman image from the host machine after build"
+help_loglvl = "select log level"
+# choices are dict keys: hashed for membership checks, yet ordered for 'help' messages
+choices_benv = dict.fromkeys(("local", "docker", "podman"))
+choices_loglvl = dict.fromkeys(("normal", "verbose", "quiet"))
+choices_base = dict.fromkeys(("los", "pa", "x", "aosp"))
+choices_chroot = dict.fromkeys(("full", "minimal"))
+choices_package_type = dict.fromkeys(("conan", "slim", "full"))
+help_logfile = "save logs to a file"
+help_ksu = "add KernelSU support"
+help_lkv = "select Linux Kernel Version"
+default_loglvl = "normal"
+
+# common arguments for subparsers, as add_argument() flags and parameters
+option_benv = (("--build-env",), {"dest": "benv", "required": True, "choices": choices_benv, "help": help_benv})
+option_base = (("--base",), {"required": True, "help": help_base, "choices": choices_base})
+option_codename = (("--codename",), {"required": True, "help": help_codename})
+option_lkv = (("--lkv",), {"required": True, "help": help_lkv})
+option_clean_image = (("--clean-image",), {"action": "store_true", "dest": "clean_image", "help": help_clean})
+option_loglvl = (
+    ("--log-level",),
+    {"dest": "loglvl", "choices": choices_loglvl, "default": default_loglvl, "help": help_loglvl}
+)
+option_outlog = (("-o", "--output"), {"dest": "outlog", "help": help_logfile})
+option_ksu = (("--ksu",), {"action": "store_true", "dest": "ksu", "help": help_ksu})
+
+# subparser names mapped to their help messages and arguments;
+# the same description is used by both argparse and the fast parser
+subparser_options = {
+    "kernel": (
+        "build the kernel",
+        (
+            option_benv,
+            option_base,
+            option_codename,
+            option_lkv,
+            (
+                ("-c", "--clean"),
+                {
+                    "dest": "clean_kernel",
+                    "action": "store_true",
+                    "help": "don't build anything, only clean kernel directories"
+                }
+            ),
+            option_clean_image,
+            option_loglvl,
+            option_outlog,
+            option_ksu,
+        )
+    ),
+    "assets": (
+        "collect assets",
+        (
+            option_benv,
+            option_base,
+            option_codename,
+            (
+                ("--chroot",),
+                {"required": True, "choices": choices_chroot, "help": "select Kali chroot type"}
+            ),
+            (
+                ("--rom-only",),
+                {"dest": "rom_only", "action": "store_true", "help": "download only the ROM as an asset"}
+            ),
+            option_clean_image,
+            (
+                ("--clean",),
+                {"dest": "clean_assets", "action": "store_true", "help": "autoclean 'assets' folder if it exists"}
+            ),
+            option_loglvl,
+            option_outlog,
+            option_ksu,
+        )
+    ),
+    "bundle": (
+        "build the kernel + collect assets",
+        (
+            option_benv,
+            option_base,
+            option_codename,
+            option_lkv,
+            (
+                ("--package-type",),
+                {
+                    "required": True,
+                    "dest": "package_type",
+                    "choices": choices_package_type,
+                    "help": "select package type of the bundle"
+                }
+            ),
+            (
+                ("--conan-upload",),
+                {"action": "store_true", "dest": "conan_upload", "help": "upload Conan packages to remote"}
+            ),
+            option_clean_image,
+            option_loglvl,
+            option_outlog,
+            option_ksu,
+        )
+    ),
+}
+
+
+def _option_dest(option_flags: tuple[str, ...], params: dict) -> str:
+    """Get the destination of an option the same way argparse does.
+
+    :param option_flags: Flags of the option.
+    :param params: Parameters of the option.
+    """
+    if "dest" in params:
+        return params["dest"]
+    long_flag = next(f for f in option_flags if f.startswith("--"))
+    return long_flag.lstrip("-").replace("-", "_")
+
+
+def _fast_parse(argv: list[str]) -> argparse.Namespace | None:
+    """Parse arguments of a subcommand in a single pass without building argparse parsers.
+
+    Only the plain "<command> --flag [value] ..." form is handled here.
+    Anything else (help, top-level options, abbreviations, missing or invalid values)
+    returns None so that argparse can process it and report errors the usual way.
+
+    :param argv: Script arguments without the program name.
+    """
+    if not argv or argv[0] not in subparser_options:
+        return None
+    # map each flag to its destination and parameters, and set the defaults
+    flags = {}
+    result = {"clean_root": False, "command": argv[0]}
+    for option_flags, params in subparser_options[argv[0]][1]:
+        dest = _option_dest(option_flags, params)
+        for flag in option_flags:
+            flags[flag] = (dest, params)
+        result[dest] = False if params.get("action") == "store_true" else params.get("default")
+    # walk through the arguments
+    tokens = iter(argv[1:])
+    for token in tokens:
+        flag, eq, value = token.partition("=")
+        if flag not in flags:
+            return None
+        dest, params = flags[flag]
+        if params.get("action") == "store_true":
+            if eq:
+                return None
+            result[dest] = True
+            continue
+        if not eq:
+            value = next(tokens, None)
+            if value is None or value.startswith("-"):
+                return None
+        if "choices" in params and value not in params["choices"]:
+            return None
+        result[dest] = value
+    # let argparse report the missing arguments
+    for option_flags, params in subparser_options[argv[0]][1]:
+        if params.get("required") and result[_option_dest(option_flags, params)] is None:
+            return None
+    return argparse.Namespace(**result)
+
 
 def parse_args() -> argparse.Namespace:
-    """Parse the script arguments."""
+    """Parse the script arguments.
+
+    Valid subcommand invocations are handled by the fast parser.
+    Otherwise, only the subparser of the selected command is populated with arguments,
+    the rest are registered as stubs so that they are still listed in 'help'.
+    When no known command is given (e.g., '--help'), all subparsers are built.
+    """
+    args = _fast_parse(sys.argv[1:])
+    if args is not None:
+        return args
     # show the 'help' message if no arguments supplied
     args = None if sys.argv[1:] else ["-h"]
+    cmd = sys.argv[1] if len(sys.argv) > 1 else None
     # parser and subparsers
     parser_parent = argparse.ArgumentParser(description="A custom wrapper for the zero kernel.")
     subparsers = parser_parent.add_subparsers(dest="command")
-    parser_kernel = subparsers.add_parser("kernel", help="build the kernel")
-    parser_assets = subparsers.add_parser("assets", help="collect assets")
-    parser_bundle = subparsers.add_parser("bundle", help="build the kernel + collect assets")
+    for name, (help_sub, options) in subparser_options.items():
+        parser_sub = subparsers.add_parser(name, help=help_sub)
+        if cmd not in subparser_options or cmd == name:
+            for option_flags, params in options:
+                parser_sub.add_argument(*option_flags, **params)
     # add a single argument for the main parser
     parser_parent.add_argument(
         "--clean",
@@ -26,195 +199,6 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="clean the root directory"
     )
-    # common argument attributes for subparsers
-    help_base = "select a kernel base for the build"
-    help_codename = "select device codename"
-    help_benv = "select build environment"
-    help_clean = "remove Docker/Podman image from the host machine after build"
-    help_loglvl = "select log level"
-    choices_benv = ("local", "docker", "podman")
-    choices_loglvl = ("normal", "verbose", "quiet")
-    choices_base = ("los", "pa", "x", "aosp")
-    help_logfile = "save logs to a file"
-    help_ksu = "add KernelSU support"
-    help_lkv = "select Linux Kernel Version"
-    default_loglvl = "normal"
-    # kernel
-    parser_kernel.add_argument(
-        "--build-env",
-        dest="benv",
-        required=True,
-        choices=choices_benv,
-        help=help_benv,
-    )
-    parser_kernel.add_argument(
-        "--base",
-        required=True,
-        help=help_base,
-        choices=choices_base
-    )
-    parser_kernel.add_argument(
-        "--codename",
-        required=True,
-        help=help_codename
-    )
-    parser_kernel.add_argument(
-        "--lkv",
-        required=True,
-        help=help_lkv
-    )
-    parser_kernel.add_argument(
-        "-c", "--clean",
-        dest="clean_kernel",
-        action="store_true",
-        help="don't build anything, only clean kernel directories"
-    )
-    parser_kernel.add_argument(
-        "--clean-image",
-        action="store_true",
-        dest="clean_image",
-        help=help_clean
-    )
-    parser_kernel.add_argument(
-        "--log-level",
-        dest="loglvl",
-        choices=choices_loglvl,
-        default=default_loglvl,
-        help=help_loglvl
-    )
-    parser_kernel.add_argument(
-        "-o", "--output",
-        dest="outlog",
-        help=help_logfile
-    )
-    parser_kernel.add_argument(
-        "--ksu",
-        action="store_true",
-        dest="ksu",
-        help=help_ksu
-    )
-    # assets
-    parser_assets.add_argument(
-        "--build-env",
-        dest="benv",
-        required=True,
-        choices=choices_benv,
-        help=help_benv
-    )
-    parser_assets.add_argument(
-        "--base",
-        required=True,
-        help=help_base,
-        choices=choices_base
-    )
-    parser_assets.add_argument(
-        "--codename",
-        required=True,
-        help=help_codename
-    )
-    parser_assets.add_argument(
-        "--chroot",
-        required=True,
-        choices=("full", "minimal"),
-        help="select Kali chroot type"
-    )
-    parser_assets.add_argument(
-        "--rom-only",
-        dest="rom_only",
-        action="store_true",
-        help="download only the ROM as an asset"
-    )
-    parser_assets.add_argument(
-        "--clean-image",
-        action="store_true",
-        dest="clean_image",
-        help=help_clean
-    )
-    parser_assets.add_argument(
-        "--clean",
-        dest="clean_assets",
-        action="store_true",
-        help="autoclean 'assets' folder if it exists"
-    )
-    parser_assets.add_argument(
-        "--log-level",
-        dest="loglvl",
-        choices=choices_loglvl,
-        default=default_loglvl,
-        help=help_loglvl
-    )
-    parser_assets.add_argument(
-        "-o", "--output",
-        dest="outlog",
-        help=help_logfile
-    )
-    parser_assets.add_argument(
-        "--ksu",
-        action="store_true",
-        dest="ksu",
-        help=help_ksu
-    )
-    # bundle
-    parser_bundle.add_argument(
-        "--build-env",
-        dest="benv",
-        required=True,
-        choices=choices_benv,
-        help=help_benv
-    )
-    parser_bundle.add_argument(
-        "--base",
-        required=True,
-        help=help_base,
-        choices=choices_base
-    )
-    parser_bundle.add_argument(
-        "--codename",
-        required=True,
-        help=help_codename
-    )
-    parser_bundle.add_argument(
-        "--lkv",
-        required=True,
-        help=help_lkv
-    )
-    parser_bundle.add_argument(
-        "--package-type",
-        required=True,
-        dest="package_type",
-        choices=("conan", "slim", "full"),
-        help="select package type of the bundle"
-    )
-    parser_bundle.add_argument(
-        "--conan-upload",
-        action="store_true",
-        dest="conan_upload",
-        help="upload Conan packages to remote"
-    )
-    parser_bundle.add_argument(
-        "--clean-image",
-        action="store_true",
-        dest="clean_image",
-        help=help_clean
-    )
-    parser_bundle.add_argument(
-        "--log-level",
-        dest="loglvl",
-        choices=choices_loglvl,
-        default=default_loglvl,
-        help=help_loglvl
-    )
-    parser_bundle.add_argument(
-        "-o", "--output",
-        dest="outlog",
-        help=help_logfile
-    )
-    parser_bundle.add_argument(
-        "--ksu",
-        action="store_true",
-        dest="ksu",
-        help=help_ksu
-    )
     return parser_parent.parse_args(args)
 
 
@@ -235,19 +219,23 @@ def main(args: argparse.Namespace) -> None:
     # setup output stream
     if args.command and args.outlog:
         msg.note(f"Writing output to {args.outlog}")
-        if args.outlog in os.listdir():
+        if os.path.lexists(args.outlog):
             os.remove(args.outlog)
         os.environ["OSTREAM"] = args.outlog
         msg.outputstream()
-    # determine the build
+    # determine the build;
+    # engines and commands are imported only when used to keep the startup fast
     match args.benv:
         case "docker":
-            DockerEngine(**json.loads(acfg.model_dump_json())).run()
+            from wrapper.engines import DockerEngine
+            DockerEngine(**acfg.model_dump()).run()
         case "podman":
-            PodmanEngine(**json.loads(acfg.model_dump_json())).run()
+            from wrapper.engines import PodmanEngine
+            PodmanEngine(**acfg.model_dump()).run()
         case "local":
             match args.command:
                 case "kernel":
+                    from wrapper.commands import KernelCommand
                     KernelCommand(
                         codename = acfg.codename,
                         base = acfg.base,
@@ -256,6 +244,7 @@ def main(args: argparse.Namespace) -> None:
                         ksu = acfg.ksu,
                     ).run()
                 case "assets":
+                    from wrapper.commands import AssetsCommand
                     AssetsCommand(
                         codename = acfg.codename,
                         base = acfg.base,
@@ -265,6 +254,7 @@ def main(args: argparse.Namespace) -> None:
                         ksu = acfg.ksu,
                     ).run()
                 case "bundle":
+                    from wrapper.commands import BundleCommand
                     BundleCommand(
                         codename = acfg.codename,
                         base = acfg.base,
@@ -1,10 +1,11 @@
-import json
-import platform
-from pathlib import Path
+import os
+import sys
+import shutil
 from typing import Optional
 from pydantic import BaseModel
 
-from wrapper.tools import commands as ccmd, messages as msg
+from wrapper.tools import fileoperations as fo, messages as msg
+from wrapper.configs.directory_config import DirectoryConfig as dcfg
 
 
 class ArgumentConfig(BaseModel):
@@ -43,17 +44,13 @@ class ArgumentConfig(BaseModel):
         """Run settings validations."""
         # allow only asset colletion on a non-Linux machine
         if self.benv == "local" and self.command in ("kernel", "bundle"):
-            if not platform.system() == "Linux":
+            if not sys.platform.startswith("linux"):
                 msg.error("Can't build kernel on a non-Linux machine.")
-            else:
-                # check that it is Debian-based
-                try:
-                    ccmd.launch("apt --version", loglvl="quiet")
-                except Exception:
-                    msg.error("Detected Linux distribution is not Debian-based.")
+            # check that it is Debian-based
+            elif not (os.path.exists("/etc/debian_version") or shutil.which("apt")):
+                msg.error("Detected Linux distribution is not Debian-based.")
         # check if specified device is supported
-        with open(Path(__file__).absolute().parents[2] / "wrapper" / "manifests" / "devices.json") as f:
-            devices = json.load(f)
+        devices = fo.load_manifest(dcfg.manifests / "devices.json")
         if self.codename not in devices.keys():
             msg.error("Unsupported device codename specified.")
         if self.command == "bundle":
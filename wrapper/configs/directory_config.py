@@ -8,3 +8,4 @@ class DirectoryConfig:
     kernel: Path = root / "kernel"
     assets: Path = root / "assets"
     bundle: Path = root / "bundle"
+    manifests: Path = root / "wrapper" / "manifests"
@@ -1,11 +1,73 @@
 import os
+import stat
+import errno
 import shutil
-import requests
-from typing import Tuple
+import hashlib
+from typing import Tuple, Optional, TYPE_CHECKING
 from pathlib import Path
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from wrapper.tools import commands as ccmd, messages as msg
 
+if TYPE_CHECKING:
+    import requests
+
+# use a faster JSON parser when it is available
+try:
+    from orjson import loads as json_loads  # pyright: ignore[reportMissingImports]
+except ImportError:
+    from json import loads as json_loads
+
+# files larger than this are copied in-kernel with copy_file_range()
+LARGE_FILE_SIZE: int = 8 * 1024 * 1024
+# files larger than this are downloaded in several parts concurrently
+PARALLEL_DOWNLOAD_SIZE: int = 32 * 1024 * 1024
+
+
+def _copy_file(src: Path, dst: Path) -> None:
+    """Copy a single file along with its permission bits.
+
+    Large files are copied with os.copy_file_range() where it is available,
+    smaller ones (or when it fails) go through shutil.copyfile().
+
+    :param src: Source file.
+    :param dst: Destination file or directory.
+    """
+    if dst.is_dir():
+        dst = dst / src.name
+    size = src.stat().st_size
+    copied = False
+    if size > LARGE_FILE_SIZE and hasattr(os, "copy_file_range"):
+        with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+            try:
+                offset = 0
+                while offset < size:
+                    sent = os.copy_file_range(fsrc.fileno(), fdst.fileno(), size - offset)
+                    if sent == 0:
+                        break
+                    offset += sent
+                copied = offset == size
+            except OSError:
+                # e.g., unsupported by the filesystem or the kernel
+                copied = False
+    if not copied:
+        shutil.copyfile(src, dst)
+    shutil.copymode(src, dst)
+
+
+def _copy_entry(src: Path, dst: Path, is_dir: bool) -> None:
+    """Copy a single directory entry, be it a file or a directory.
+
+    :param src: Source path.
+    :param dst: Destination path.
+    :param is_dir: Flag indicating that the entry is a directory.
+    """
+    if is_dir:
+        shutil.copytree(src, dst)
+    else:
+        _copy_file(src, dst)
+
 
 def ucopy(src: Path, dst: Path, exceptions: Tuple[str] = ()) -> None:
     """A universal method to copy files into desired destinations.
@@ -14,29 +76,143 @@ def ucopy(src: Path, dst: Path, exceptions: Tuple[str] = ()) -> None:
     :param dst: Destination path.
     :param exceptions: Elements that will not be removed.
     """
+    try:
+        mode = os.stat(src).st_mode
+    except OSError as e:
+        # skip a missing source, ignoring the same errors as Path.is_dir()/is_file()
+        if e.errno not in (errno.ENOENT, errno.ENOTDIR, errno.EBADF, errno.ELOOP):
+            raise
+        return
     # for a directory (it's contents)
-    if src.is_dir():
+    if stat.S_ISDIR(mode):
         if not dst.is_dir():
             os.mkdir(dst)
-        contents = os.listdir(src)
-        for e in contents:
-            # do not copy restricted files
-            if e not in exceptions and e != src:
-                src_e = src / e
-                dst_e = dst / e
-                if src_e.is_dir():
-                    shutil.copytree(src_e, dst_e)
-                elif src_e.is_file():
-                    shutil.copy(src_e, dst_e)
+        # entry types come from the directory listing itself, without extra stat() calls
+        tasks = []
+        with os.scandir(src) as it:
+            for entry in it:
+                # do not copy restricted files
+                if entry.name in exceptions or entry.name == src:
+                    continue
+                if entry.is_dir():
+                    tasks.append((Path(entry.path), dst / entry.name, True))
+                elif entry.is_file():
+                    tasks.append((Path(entry.path), dst / entry.name, False))
+        # entries are independent of each other, so copy them concurrently
+        if tasks:
+            with ThreadPoolExecutor(max_workers=min(4, len(tasks))) as executor:
+                futures = [executor.submit(_copy_entry, *task) for task in tasks]
+                try:
+                    for future in as_completed(futures):
+                        future.result()
+                except Exception:
+                    # stop at the first error, as a sequential copy would
+                    executor.shutdown(cancel_futures=True)
+                    raise
     # for a single file
-    elif src.is_file():
-        shutil.copy(src, dst)
+    elif stat.S_ISREG(mode):
+        _copy_file(src, dst)
+
+
+@lru_cache(maxsize=1)
+def _session() -> "requests.Session":
+    """A shared HTTP session to reuse connections across downloads."""
+    # requests is heavy to import and is only needed for downloads
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=8, pool_maxsize=16, max_retries=Retry(total=3, backoff_factor=0.3))
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
 
 
-def download(url: str) -> None:
+def _download_part(url: str, fd: int, start: int, end: int) -> bool:
+    """Download a byte range of the file and write it at its offset.
+
+    Returns False if the server responds with the whole file instead of the range.
+
+    :param url: URL to the file.
+    :param fd: File descriptor of the output file.
+    :param start: First byte of the range.
+    :param end: Last byte of the range (inclusive).
+    """
+    headers = {"referer": url, "Range": f"bytes={start}-{end}"}
+    with _session().get(url, stream=True, headers=headers) as r:
+        r.raise_for_status()
+        if r.status_code != 206:
+            return False
+        offset = start
+        for chunk in r.iter_content(chunk_size=1 << 20):
+            offset += os.pwrite(fd, chunk, offset)
+    if offset != end + 1:
+        raise RuntimeError(f"Incomplete range received for {url}")
+    return True
+
+
+def _parallel_download(url: str, fn: str, size: int, parts: int = 4) -> bool:
+    """Download the file in several byte ranges concurrently.
+
+    Returns False if the server does not serve range requests.
+
+    :param url: URL to the file.
+    :param fn: Name of the output file.
+    :param size: Size of the file in bytes.
+    :param parts: Number of concurrent parts.
+    """
+    step = -(-size // parts)
+    ranges = [(start, min(start + step, size) - 1) for start in range(0, size, step)]
+    with open(fn, "wb") as f:
+        os.ftruncate(f.fileno(), size)
+        with ThreadPoolExecutor(max_workers=parts) as executor:
+            return all(executor.map(lambda rng: _download_part(url, f.fileno(), *rng), ranges))
+
+
+def _write_response(r: "requests.Response", fn: str, sha256: Optional[str] = None) -> Optional[str]:
+    """Write the response body into the file.
+
+    Returns the SHA-256 checksum of the data if the expected one is given.
+
+    :param r: Streamed response.
+    :param fn: Name of the output file.
+    :param sha256: Expected SHA-256 checksum of the file.
+    """
+    # let the raw stream handle gzip/deflate and copy it in large blocks
+    r.raw.decode_content = True
+    digest = hashlib.sha256() if sha256 else None
+    with open(fn, 'wb') as f:
+        while chunk := r.raw.read(1 << 20):
+            # hash the data on the way to avoid reading the file back
+            if digest:
+                digest.update(chunk)
+            f.write(chunk)
+    return digest.hexdigest() if digest else None
+
+
+def _verify_sha256(fn: str | Path, sha256: str, checksum: Optional[str] = None) -> None:
+    """Compare the checksum of the file with the expected one.
+
+    A mismatching file is removed.
+
+    :param fn: Name of the file.
+    :param sha256: Expected SHA-256 checksum.
+    :param checksum: Already calculated SHA-256 checksum of the file.
+    """
+    if checksum is None:
+        with open(fn, "rb") as f:
+            checksum = hashlib.file_digest(f, "sha256").hexdigest()
+    if checksum != sha256.lower():
+        os.remove(fn)
+        msg.error(f"Checksum mismatch for {fn}: expected {sha256}, got {checksum}")
+
+
+def download(url: str, sha256: Optional[str] = None) -> None:
     """A simple file downloader.
 
     :param url: URL to the file.
+    :param sha256: Expected SHA-256 checksum of the file.
     """
     fn = url.split("/")[-1]
     msg.note(f"Downloading {fn} ..")
@@ -46,17 +222,45 @@ def download(url: str) -> None:
             msg.note("Sorceforge URL detected, using wget..")
             fn = url.split("/download")[0].split("/")[-1]
             ccmd.launch(f"wget -O {fn} {url}")
+            if sha256:
+                _verify_sha256(fn, sha256)
         else:
-            with requests.get(url, stream=True, headers={"referer": url}) as r:
+            checksum = None
+            with _session().get(url, stream=True, headers={"referer": url}) as r:
                 r.raise_for_status()
-                with open(fn, 'wb') as f:
-                    for chunk in r.iter_content(chunk_size=8192):
-                        f.write(chunk)
+                size = int(r.headers.get("Content-Length", 0))
+                # large files are fetched in parallel if the server supports ranges
+                ranged = r.headers.get("Accept-Ranges") == "bytes" and not r.headers.get("Content-Encoding") \
+                    and size >= PARALLEL_DOWNLOAD_SIZE
+                if not ranged:
+                    checksum = _write_response(r, fn, sha256)
+            # the initial response is closed here, so it does not compete with the parts;
+            # parts are requested from the final location to avoid redirecting each of them
+            if ranged and not _parallel_download(r.url, fn, size):
+                msg.note("Range requests are not served, downloading in a single stream..")
+                with _session().get(r.url, stream=True, headers={"referer": url}) as rs:
+                    rs.raise_for_status()
+                    checksum = _write_response(rs, fn, sha256)
+            # parts of a parallel download arrive out of order and are hashed afterwards
+            if sha256:
+                _verify_sha256(fn, sha256, checksum)
     except Exception:
         msg.error("Download failed.")
     msg.done("Done!")
 
 
+@lru_cache(maxsize=8)
+def load_manifest(path: Path) -> dict:
+    """Load a JSON manifest, caching the result per path.
+
+    The returned data is shared between calls and must not be modified in place.
+
+    :param path: Absolute path to the manifest.
+    """
+    with open(path, "rb") as f:
+        return json_loads(f.read())
+
+
 def replace_lines(filename: Path, og_lines: Tuple[str], nw_lines: Tuple[str]) -> None:
     """Replace lines in the specified file.
 
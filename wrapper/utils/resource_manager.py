@@ -1,5 +1,5 @@
 import os
-import json
+import copy
 import tarfile
 from typing import Optional
 
@@ -29,23 +29,23 @@ class ResourceManager:
         tools = ""
         device = ""
         # load JSON data
-        with open(dcfg.root / "wrapper" / "manifests" / "tools.json") as f:
-            tools = json.load(f)
+        tools = fo.load_manifest(dcfg.manifests / "tools.json")
         # codename and ROM are undefined only when the Docker/Podman image is being prepared
         if self._codename and self._base:
-            with open(dcfg.root / "wrapper" / "manifests" / "devices.json") as f:
-                data = json.load(f)
-                # load data only for the required codename + linux kernel version combination
-                try:
-                    data[self._codename][self._lkv][self._base]
-                except Exception:
-                    msg.error("Arguments were specified for an unsupported build, exiting..")
-                device = {self._codename: data[self._codename][self._lkv][self._base]}
+            data = fo.load_manifest(dcfg.manifests / "devices.json")
+            # load data only for the required codename + linux kernel version combination
+            try:
+                data[self._codename][self._lkv][self._base]
+            except Exception:
+                msg.error("Arguments were specified for an unsupported build, exiting..")
+            device = {self._codename: data[self._codename][self._lkv][self._base]}
             # join tools and devices manifests
             self.paths = {**tools, **device}
         else:
             self.paths = tools
             msg.note("Only shared tools are installed.")
+        # manifests are cached, so work on a copy of them
+        self.paths = copy.deepcopy(self.paths)
         for e in self.paths:
             # convert path into it's absolute form
             self.paths[e]["path"] = dcfg.root / self.paths[e]["path"]